@@ -5,6 +5,8 @@ for the spec file format.
 import numpy as np
 import pandas as pd
 import os
+import fnmatch
+from collections import namedtuple
 from datetime import datetime
 
 # Dictionary that maps a spec metadata line to a specific lambda function
@@ -155,6 +157,49 @@ def parse_spec_scan(raw_scan_data):
     return md, scan_data
 
 
+StackedScans = namedtuple(
+    'StackedScans',
+    ['scan_ids', 'columns', 'data', 'mask', 'lengths', 'motor_names',
+     'motor_values'])
+
+
+def _resolve_columns(col_names, columns=None, pattern=None):
+    """Expand the column names / globs into concrete column names
+
+    Parameters
+    ----------
+    col_names : list
+        The available column names, in order
+    columns : str or list, optional
+        Column names or fnmatch-style globs. Defaults to all columns if
+        neither `columns` nor `pattern` is given
+    pattern : str, optional
+        An extra fnmatch-style glob, e.g. 'TD*'
+
+    Returns
+    -------
+    resolved : list
+        The matching column names with duplicates removed. Order follows
+        `columns` (then `pattern`), and `col_names` within a single glob
+    """
+    if columns is None and pattern is None:
+        return list(col_names)
+    if isinstance(columns, str):
+        columns = [columns]
+    globs = list(columns or [])
+    if pattern is not None:
+        globs.append(pattern)
+    resolved = []
+    for glob in globs:
+        matches = fnmatch.filter(col_names, glob)
+        if not matches:
+            raise KeyError(
+                '{} does not match any of the column names {}'
+                ''.format(glob, col_names))
+        resolved.extend(m for m in matches if m not in resolved)
+    return resolved
+
+
 class Specfile:
     def __init__(self, filename):
         self.filename = os.path.abspath(filename)
@@ -181,6 +226,81 @@ class Specfile:
     def __repr__(self):
         return "Specfile('{}')".format(self.filename)
 
+    def stack(self, scans=None, columns=None, pattern=None):
+        """Stack the data from many scans into one padded array
+
+        Parameters
+        ----------
+        scans : iterable, optional
+            The scan ids to stack. Defaults to all scans in the file
+        columns : str or list, optional
+            Column names or fnmatch-style globs, e.g. ['H*', 'TD*'].
+            Defaults to all columns if neither `columns` nor `pattern` is
+            given
+        pattern : str, optional
+            An extra fnmatch-style glob that is appended to `columns`
+
+        Returns
+        -------
+        stacked : StackedScans
+            namedtuple with the fields
+
+            - scan_ids : list of the stacked scan ids
+            - columns : list of the column names the globs resolved to
+            - data : array of shape (n_scans, max_points, n_columns).
+              Padded points and columns missing from a scan are NaN
+            - mask : boolean array, same shape as `data`. True where
+              `data` holds a measured value
+            - lengths : int array of the number of points in each scan
+            - motor_names : the spec names of the motors from the header,
+              padded with None if a scan has more #P values than that
+            - motor_values : array of shape (n_scans, n_motors) from the
+              #P lines, NaN padded
+
+        Notes
+        -----
+        Globs are resolved once against the union of the column names of
+        all the requested scans. Raises KeyError if a glob does not match
+        anything.
+        """
+        scans = sorted(self.scans) if scans is None else list(scans)
+        specscans = [self.scans[sid] for sid in scans]
+        col_names = []
+        for scan in specscans:
+            col_names.extend(c for c in scan.md.get('col_names', [])
+                             if c not in col_names)
+        columns = _resolve_columns(col_names, columns, pattern)
+
+        lengths = np.array([len(scan) for scan in specscans], dtype=int)
+        max_points = lengths.max() if len(lengths) else 0
+        data = np.full((len(specscans), max_points, len(columns)), np.nan)
+        mask = np.zeros(data.shape, dtype=bool)
+        for i, scan in enumerate(specscans):
+            if not lengths[i]:
+                continue
+            src, dst = [], []
+            for j, col in enumerate(columns):
+                if col in scan.col_names:
+                    # data[i, :n, dst] puts the column axis first
+                    src.append(scan.col_names.index(col))
+                    dst.append(j)
+            values = scan.scan_data.values
+            data[i, :lengths[i], dst] = values[:, src].T
+            mask[i, :lengths[i], dst] = True
+
+        motor_names = list(self.parsed_header['motor_spec_names'])
+        n_motors = max([len(motor_names)] +
+                       [len(scan.motor_values) for scan in specscans])
+        # keep the names aligned with the columns of motor_values if a scan
+        # has more #P values than the header declares
+        motor_names.extend([None] * (n_motors - len(motor_names)))
+        motor_values = np.full((len(specscans), n_motors), np.nan)
+        for i, scan in enumerate(specscans):
+            motor_values[i, :len(scan.motor_values)] = scan.motor_values
+
+        return StackedScans(scans, columns, data, mask, lengths,
+                            motor_names, motor_values)
+
     def __str__(self):
         return """
 {0}
@@ -202,6 +322,8 @@ class Specscan:
         return "{}[{}]".format(repr(self.specfile), self.scan_id)
 
     def __len__(self):
+        if self.scan_data is None:
+            return 0
         return len(self.scan_data)
 
     def __eq__(self, obj):
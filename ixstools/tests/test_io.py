@@ -1,5 +1,6 @@
 import ixstools
 from ixstools.io import Specfile
+import numpy as np
 import random
 random.seed('test_io.py')
 import pytest
@@ -28,3 +29,56 @@ def test_specfile_header_parsing(specfile_object):
         # are the same length as the list in the header
         assert (len(sf.parsed_header['motor_spec_names']) ==
                 len(scan.motor_values))
+
+
+def test_specfile_stack(specfile_object):
+    sf = specfile_object
+    scans = sorted(sf.scans)[:5]
+    stacked = sf.stack(scans, columns=['Monitor'], pattern='TD*')
+    assert stacked.scan_ids == scans
+    assert stacked.columns[0] == 'Monitor'
+    assert all(col.startswith('TD') for col in stacked.columns[1:])
+    n_points = max(len(sf[sid]) for sid in scans)
+    assert stacked.data.shape == (len(scans), n_points, len(stacked.columns))
+    assert stacked.mask.shape == stacked.data.shape
+    assert stacked.motor_values.shape == (len(scans),
+                                          len(stacked.motor_names))
+    for i, sid in enumerate(scans):
+        scan = sf[sid]
+        assert stacked.lengths[i] == len(scan)
+        assert not stacked.mask[i, len(scan):].any()
+        for j, col in enumerate(stacked.columns):
+            if col in scan.col_names:
+                assert np.array_equal(stacked.data[i, :len(scan), j],
+                                      scan.scan_data[col].values)
+                assert stacked.mask[i, :len(scan), j].all()
+            else:
+                assert not stacked.mask[i, :, j].any()
+        assert np.array_equal(stacked.motor_values[i], scan.motor_values)
+    assert np.isnan(stacked.data[~stacked.mask]).all()
+
+    # generators are only read once
+    stacked = sf.stack((sid for sid in scans), pattern='TD*')
+    assert stacked.scan_ids == scans
+    assert stacked.data.shape[0] == len(scans)
+
+
+def test_specfile_stack_defaults(specfile_object):
+    sf = specfile_object
+    stacked = sf.stack()
+    assert stacked.scan_ids == sorted(sf.scans)
+    all_cols = set(col for scan in sf for col in scan.md.get('col_names', []))
+    assert set(stacked.columns) == all_cols
+    assert len(stacked.motor_names) == stacked.motor_values.shape[1]
+    assert np.isnan(stacked.data[~stacked.mask]).all()
+    assert (stacked.mask.sum(axis=(1, 2)) > 0).all()
+    for i, scan in enumerate(sf):
+        assert stacked.lengths[i] == len(scan)
+        assert not stacked.mask[i, len(scan):].any()
+        assert (stacked.mask[i, :len(scan)].sum(axis=1) ==
+                len(scan.col_names)).all()
+
+
+def test_specfile_stack_bad_glob(specfile_object):
+    with pytest.raises(KeyError):
+        specfile_object.stack(pattern='not a column*')